@@ -12,24 +12,24 @@ def check_textures():
     db = client[DATABASE_NAME]
     collection = db[COLLECTION_NAME]
     
-    total = collection.count_documents({})
+    total = collection.estimated_document_count()
     print(f"\n📊 Total exoplanets in database: {total}")
     
-    with_high = collection.count_documents({'texture_high_url': {'$exists': True}})
+    with_high = collection.count_documents({'texture_high_png': {'$exists': True}})
     print(f"✅ Planets with high-res textures: {with_high} ({with_high/total*100:.1f}%)")
     
-    with_low = collection.count_documents({'texture_low_url': {'$exists': True}})
+    with_low = collection.count_documents({'texture_low_png': {'$exists': True}})
     print(f"✅ Planets with low-res textures: {with_low} ({with_low/total*100:.1f}%)")
     
     if with_high > 0:
         print("\n🔍 Sample planet with textures:")
         sample = collection.find_one(
-            {'texture_high_url': {'$exists': True}},
-            {'name': 1, 'texture_high_url': 1, 'texture_low_url': 1}
+            {'texture_high_png': {'$exists': True}},
+            {'name': 1, 'texture_high_png': 1, 'texture_low_png': 1}
         )
         if sample:
-            high_size = len(sample.get('texture_high_url', ''))
-            low_size = len(sample.get('texture_low_url', ''))
+            high_size = len(sample.get('texture_high_png', b''))
+            low_size = len(sample.get('texture_low_png', b''))
             print(f"  Name: {sample.get('name')}")
             print(f"  High-res size: {high_size:,} bytes ({high_size/1024:.1f} KB)")
             print(f"  Low-res size: {low_size:,} bytes ({low_size/1024:.1f} KB)")
@@ -1,20 +1,27 @@
 #!/usr/bin/env python3
 
 import argparse
-import base64
 import io
-import math
+import os
 import random
 import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
 from enum import Enum
+from functools import lru_cache
 from typing import Tuple, Optional
-from PIL import Image, ImageDraw, ImageFilter
-from pymongo import MongoClient
+import numpy as np
+from PIL import Image, ImageDraw
+from bson import Binary
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
 from datetime import datetime
 
 MONGODB_URI = "mongodb://localhost:27017/"
 DATABASE_NAME = "exoplanet_explorer"
 COLLECTION_NAME = "exoplanets"
+BULK_WRITE_BATCH_SIZE = 100
+PNG_COMPRESS_LEVEL = 1
+TEXTURE_INPUT_FIELDS = {'_id': 1, 'name': 1, 'mass': 1, 'radius': 1, 'temp_calculated': 1, 'temp_measured': 1}
 
 class PlanetType(Enum):
     HOT_JUPITER = "hot_jupiter"
@@ -31,14 +38,57 @@ JUPITER_RADIUS = 11.2
 NEPTUNE_MASS = 17.1
 NEPTUNE_RADIUS = 3.88
 
+HOT_JUPITER_EXTREME = ((0x5a, 0x38, 0x20), (0x3d, 0x25, 0x10), (0x8a, 0x55, 0x30))
+HOT_JUPITER_HOT = ((0x6a, 0x45, 0x30), (0x4a, 0x30, 0x20), (0x9a, 0x65, 0x40))
+HOT_JUPITER_WARM = ((0x7a, 0x58, 0x40), (0x5a, 0x40, 0x30), (0xaa, 0x78, 0x60))
+WARM_NEPTUNE_COLORS = ((0x8b, 0xc5, 0xe8), (0x6b, 0xa3, 0xd0), (0xaa, 0xe5, 0xff))
+ICE_GIANT_COLD = ((0x6a, 0x8f, 0xc5), (0x4a, 0x6f, 0xa5), (0x8a, 0xaf, 0xe5))
+ICE_GIANT_TEMPERATE = ((0x9a, 0xd8, 0xe5), (0x7a, 0xb8, 0xc5), (0xba, 0xf8, 0xff))
+MINI_NEPTUNE_CLOUDY = ((0xe5, 0xf5, 0xff), (0xc5, 0xd5, 0xe5), (0xff, 0xff, 0xff))
+MINI_NEPTUNE_HAZY = ((0xaa, 0xd5, 0xf5), (0x8a, 0xb5, 0xd5), (0xca, 0xf5, 0xff))
+MINI_NEPTUNE_CLEAR = ((0x8a, 0xaf, 0xb5), (0x6a, 0x8f, 0xa5), (0xaa, 0xcf, 0xd5))
+SUPER_EARTH_LAVA = ((0xff, 0x7a, 0x40), (0xe8, 0x5a, 0x20), (0xff, 0xaa, 0x70))
+SUPER_EARTH_DESERT = ((0xd8, 0xb0, 0x90), (0xb8, 0x90, 0x70), (0xf8, 0xd0, 0xb0))
+SUPER_EARTH_OCEAN = ((0x4d, 0x7a, 0xaa), (0x3d, 0x6a, 0x9a), (0x6d, 0x9a, 0xca))
+SUPER_EARTH_FOREST = ((0x6a, 0x9a, 0x7a), (0x5a, 0x8a, 0x6a), (0x8a, 0xba, 0x9a))
+SUPER_EARTH_ARID = ((0xaa, 0x9a, 0x7a), (0x8a, 0x7a, 0x5a), (0xca, 0xba, 0x9a))
+SUPER_EARTH_ICE = ((0xe5, 0xf5, 0xff), (0xc5, 0xd5, 0xe5), (0xff, 0xff, 0xff))
+TERRESTRIAL_MOLTEN = ((0xf8, 0xe0, 0xb0), (0xd8, 0xc0, 0x90), (0xff, 0xff, 0xd0))
+TERRESTRIAL_DESERT = ((0xe8, 0xb0, 0x80), (0xc8, 0x90, 0x60), (0xff, 0xd0, 0xa0))
+TERRESTRIAL_OCEAN = ((0x5d, 0x8a, 0xba), (0x4d, 0x7a, 0xaa), (0x7d, 0xaa, 0xdd))
+TERRESTRIAL_FOREST = ((0x7a, 0x9a, 0x8a), (0x6a, 0x8a, 0x7a), (0x9a, 0xba, 0xaa))
+TERRESTRIAL_ARID = ((0xba, 0xaa, 0x8a), (0x9a, 0x8a, 0x6a), (0xda, 0xca, 0xaa))
+TERRESTRIAL_MARS = ((0xe8, 0x9a, 0x70), (0xc8, 0x7a, 0x50), (0xff, 0xba, 0x90))
+TERRESTRIAL_ICE = ((0xf5, 0xff, 0xff), (0xd5, 0xe5, 0xf5), (0xff, 0xff, 0xff))
+DEFAULT_COLORS = ((160, 160, 160), (128, 128, 128), (192, 192, 192))
+
+
+def planet_temperature(exoplanet: dict) -> float:
+    return exoplanet.get('temp_calculated') or exoplanet.get('temp_measured') or 300
+
 
 def classify_planet(exoplanet: dict) -> PlanetType:
     mass = exoplanet.get('mass', EARTH_MASS)
     radius = exoplanet.get('radius', EARTH_RADIUS)
-    temp = exoplanet.get('temp_calculated') or exoplanet.get('temp_measured') or 300
+    
+    return classify_planet_binned(round(mass, 3), round(radius, 3), round(planet_temperature(exoplanet)))
+
+
+@lru_cache(maxsize=4096)
+def classify_planet_binned(mass: float, radius: float, temp: int) -> PlanetType:
+    # Small planets dominate the catalog, so they are classified first. None of the
+    # giant-planet cases below can match a planet that returns early here.
+    if radius <= 1.5:
+        return PlanetType.TERRESTRIAL
     
     density = mass / (radius ** 3)
     
+    if density >= 1.2:
+        return PlanetType.SUPER_EARTH
+    
+    if radius <= 3:
+        return PlanetType.MINI_NEPTUNE
+    
     if radius > 8 and temp > 1000 and density < 0.4:
         return PlanetType.HOT_JUPITER
     
@@ -48,93 +98,79 @@ def classify_planet(exoplanet: dict) -> PlanetType:
     if radius > 3 and temp < 500 and density < 0.8:
         return PlanetType.ICE_GIANT
     
-    if 1.5 < radius < 4 and density < 1.2:
+    if radius < 4:
         return PlanetType.MINI_NEPTUNE
     
-    if radius > 1.5 and density >= 1.2:
-        return PlanetType.SUPER_EARTH
-    
     return PlanetType.TERRESTRIAL
 
 
 def get_scientific_colors(exoplanet: dict, planet_type: PlanetType) -> Tuple[Tuple[int, int, int], Tuple[int, int, int], Tuple[int, int, int]]:
-    temp = exoplanet.get('temp_calculated') or exoplanet.get('temp_measured') or 300
-    
-    def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-    
+    options = scientific_color_options(planet_type, round(planet_temperature(exoplanet)))
+    if len(options) == 1:
+        return options[0][1]
+    
+    roll = random.random()
+    for upper_bound, colors in options:
+        if roll < upper_bound:
+            return colors
+    return options[-1][1]
+
+
+@lru_cache(maxsize=4096)
+def scientific_color_options(planet_type: PlanetType, temp: int) -> Tuple[Tuple[float, Tuple], ...]:
     if planet_type == PlanetType.HOT_JUPITER:
         if temp > 2000:
-            return hex_to_rgb('#5a3820'), hex_to_rgb('#3d2510'), hex_to_rgb('#8a5530')
+            return ((1.0, HOT_JUPITER_EXTREME),)
         elif temp > 1500:
-            return hex_to_rgb('#6a4530'), hex_to_rgb('#4a3020'), hex_to_rgb('#9a6540')
+            return ((1.0, HOT_JUPITER_HOT),)
         else:
-            return hex_to_rgb('#7a5840'), hex_to_rgb('#5a4030'), hex_to_rgb('#aa7860')
+            return ((1.0, HOT_JUPITER_WARM),)
     
     elif planet_type == PlanetType.WARM_NEPTUNE:
-        return hex_to_rgb('#8bc5e8'), hex_to_rgb('#6ba3d0'), hex_to_rgb('#aae5ff')
+        return ((1.0, WARM_NEPTUNE_COLORS),)
     
     elif planet_type == PlanetType.ICE_GIANT:
         if temp < 100:
-            return hex_to_rgb('#6a8fc5'), hex_to_rgb('#4a6fa5'), hex_to_rgb('#8aafe5')
+            return ((1.0, ICE_GIANT_COLD),)
         else:
-            return hex_to_rgb('#9ad8e5'), hex_to_rgb('#7ab8c5'), hex_to_rgb('#baf8ff')
+            return ((1.0, ICE_GIANT_TEMPERATE),)
     
     elif planet_type == PlanetType.MINI_NEPTUNE:
-        cloudiness = random.random()
-        if cloudiness > 0.7:
-            return hex_to_rgb('#e5f5ff'), hex_to_rgb('#c5d5e5'), hex_to_rgb('#ffffff')
-        elif cloudiness > 0.4:
-            return hex_to_rgb('#aad5f5'), hex_to_rgb('#8ab5d5'), hex_to_rgb('#caf5ff')
-        else:
-            return hex_to_rgb('#8aafb5'), hex_to_rgb('#6a8fa5'), hex_to_rgb('#aacfd5')
+        return ((0.4, MINI_NEPTUNE_CLEAR), (0.7, MINI_NEPTUNE_HAZY), (1.0, MINI_NEPTUNE_CLOUDY))
     
     elif planet_type == PlanetType.SUPER_EARTH:
         if temp > 700:
-            return hex_to_rgb('#ff7a40'), hex_to_rgb('#e85a20'), hex_to_rgb('#ffaa70')
+            return ((1.0, SUPER_EARTH_LAVA),)
         elif temp > 400:
-            return hex_to_rgb('#d8b090'), hex_to_rgb('#b89070'), hex_to_rgb('#f8d0b0')
+            return ((1.0, SUPER_EARTH_DESERT),)
         elif temp > 250:
-            variation = random.random()
-            if variation < 0.4:
-                return hex_to_rgb('#4d7aaa'), hex_to_rgb('#3d6a9a'), hex_to_rgb('#6d9aca')
-            elif variation < 0.7:
-                return hex_to_rgb('#6a9a7a'), hex_to_rgb('#5a8a6a'), hex_to_rgb('#8aba9a')
-            else:
-                return hex_to_rgb('#aa9a7a'), hex_to_rgb('#8a7a5a'), hex_to_rgb('#caba9a')
+            return ((0.4, SUPER_EARTH_OCEAN), (0.7, SUPER_EARTH_FOREST), (1.0, SUPER_EARTH_ARID))
         else:
-            return hex_to_rgb('#e5f5ff'), hex_to_rgb('#c5d5e5'), hex_to_rgb('#ffffff')
+            return ((1.0, SUPER_EARTH_ICE),)
     
     elif planet_type == PlanetType.TERRESTRIAL:
         if temp > 600:
-            return hex_to_rgb('#f8e0b0'), hex_to_rgb('#d8c090'), hex_to_rgb('#ffffd0')
+            return ((1.0, TERRESTRIAL_MOLTEN),)
         elif temp > 350:
-            return hex_to_rgb('#e8b080'), hex_to_rgb('#c89060'), hex_to_rgb('#ffd0a0')
+            return ((1.0, TERRESTRIAL_DESERT),)
         elif temp > 200:
-            variation = random.random()
-            if variation < 0.3:
-                return hex_to_rgb('#5d8aba'), hex_to_rgb('#4d7aaa'), hex_to_rgb('#7daadd')
-            elif variation < 0.6:
-                return hex_to_rgb('#7a9a8a'), hex_to_rgb('#6a8a7a'), hex_to_rgb('#9abaaa')
-            else:
-                return hex_to_rgb('#baaa8a'), hex_to_rgb('#9a8a6a'), hex_to_rgb('#dacaaa')
+            return ((0.3, TERRESTRIAL_OCEAN), (0.6, TERRESTRIAL_FOREST), (1.0, TERRESTRIAL_ARID))
         elif temp > 150:
-            return hex_to_rgb('#e89a70'), hex_to_rgb('#c87a50'), hex_to_rgb('#ffba90')
+            return ((1.0, TERRESTRIAL_MARS),)
         else:
-            return hex_to_rgb('#f5ffff'), hex_to_rgb('#d5e5f5'), hex_to_rgb('#ffffff')
+            return ((1.0, TERRESTRIAL_ICE),)
     
-    return (160, 160, 160), (128, 128, 128), (192, 192, 192)
+    return ((1.0, DEFAULT_COLORS),)
 
 
-def simple_perlin_noise(x: float, y: float, scale: float = 10, octaves: int = 3) -> float:
+def simple_perlin_noise(x, y, scale: float = 10, octaves: int = 3):
     value = 0
     amplitude = 1
     frequency = scale
     max_value = 0
     
     for _ in range(octaves):
-        value += math.sin(x * frequency) * math.cos(y * frequency) * amplitude
+        value += np.sin(x * frequency) * np.cos(y * frequency) * amplitude
         max_value += amplitude
         amplitude *= 0.5
         frequency *= 2
@@ -143,41 +179,38 @@ def simple_perlin_noise(x: float, y: float, scale: float = 10, octaves: int = 3)
 
 
 def add_noise(img: Image.Image, intensity: int = 25):
-    pixels = img.load()
-    width, height = img.size
+    arr = np.asarray(img, dtype=np.int16)
+    height, width = arr.shape[:2]
+    
+    noise = np.random.randint(-intensity, intensity + 1, size=(height, width), dtype=np.int16)[:, :, None]
+    np.clip(arr + noise, 0, 255, out=arr)
     
-    for y in range(height):
-        for x in range(width):
-            r, g, b = pixels[x, y]
-            noise = random.randint(-intensity, intensity)
-            pixels[x, y] = (
-                max(0, min(255, r + noise)),
-                max(0, min(255, g + noise)),
-                max(0, min(255, b + noise))
-            )
+    img.paste(Image.fromarray(arr.astype(np.uint8)))
 
 
 def draw_atmospheric_bands(img: Image.Image, colors: Tuple, turbulence: float = 1.0):
-    draw = ImageDraw.Draw(img)
     width, height = img.size
     bands = random.randint(6, 12)
     
-    for i in range(bands):
-        y = (i / bands) * height
-        band_height = height / bands
-        
-        color = colors[1] if i % 2 == 0 else colors[2]
-        
-        points = []
-        for x in range(0, width + 5, 5):
-            wave1 = math.sin(x / width * math.pi * 6 + i) * turbulence * 8
-            wave2 = math.sin(x / width * math.pi * 3 + i * 2) * turbulence * 4
-            wave_y = y + wave1 + wave2
-            points.append((x, wave_y))
-        
-        if points:
-            points.extend([(width, y + band_height), (0, y + band_height)])
-            draw.polygon(points, fill=color)
+    band_idx = np.arange(bands)[:, None]
+    phase = np.arange(width) / width * np.pi
+    wave = (np.sin(phase * 6 + band_idx) * turbulence * 8 +
+            np.sin(phase * 3 + band_idx * 2) * turbulence * 4)
+    
+    y_base = band_idx / bands * height
+    top = (y_base + wave)[:, None, :]
+    bottom = (y_base + height / bands)[:, :, None]
+    rows = np.arange(height)[None, :, None]
+    covered = (rows >= top) & (rows < bottom)
+    
+    # Later bands are painted over earlier ones, so each pixel takes the last band covering it
+    band = bands - 1 - np.argmax(covered[::-1], axis=0)
+    mask = covered.any(axis=0)
+    band_colors = np.array([colors[1] if i % 2 == 0 else colors[2] for i in range(bands)], dtype=np.uint8)
+    
+    arr = np.array(img)
+    arr[mask] = band_colors[band[mask]]
+    img.paste(Image.fromarray(arr))
 
 
 def draw_clouds(img: Image.Image, colors: Tuple, density: float = 0.3, pattern: str = 'wisps'):
@@ -206,13 +239,18 @@ def draw_clouds(img: Image.Image, colors: Tuple, density: float = 0.3, pattern:
     
     else:
         step = 2
-        for y in range(0, height, step):
-            for x in range(0, width, step):
-                noise = simple_perlin_noise(x / width, y / height, 8, 2)
-                if noise > (1 - density):
-                    alpha = int((noise - (1 - density)) / density * 0.5 * 255)
-                    color = colors[1] + (alpha,)
-                    draw.rectangle([(x, y), (x + step, y + step)], fill=color)
+        xs = np.arange(0, width, step) / width
+        ys = np.arange(0, height, step) / height
+        noise = simple_perlin_noise(xs[None, :], ys[:, None], 8, 2)
+        
+        threshold = 1 - density
+        alpha = np.where(noise > threshold, (noise - threshold) / density * 0.5 * 255, 0)
+        
+        cells = np.empty(noise.shape + (4,), dtype=np.uint8)
+        cells[..., :3] = colors[1]
+        cells[..., 3] = alpha.astype(np.uint8)
+        cells = cells.repeat(step, axis=0).repeat(step, axis=1)[:height, :width]
+        overlay = Image.fromarray(cells)
     
     img.paste(overlay, (0, 0), overlay)
 
@@ -236,7 +274,7 @@ def generate_planet_texture(exoplanet: dict, resolution: Optional[int] = None) -
     
     planet_type = classify_planet(exoplanet)
     colors = get_scientific_colors(exoplanet, planet_type)
-    temp = exoplanet.get('temp_calculated') or exoplanet.get('temp_measured') or 300
+    temp = planet_temperature(exoplanet)
     
     img = Image.new('RGB', (size, size), colors[0])
     
@@ -284,8 +322,6 @@ def generate_planet_texture(exoplanet: dict, resolution: Optional[int] = None) -
         else:
             add_noise(img, intensity=15)
     
-    img = img.filter(ImageFilter.GaussianBlur(radius=0.5))
-    
     return img
 
 
@@ -295,74 +331,117 @@ def generate_simple_texture(exoplanet: dict) -> Image.Image:
     planet_type = classify_planet(exoplanet)
     colors = get_scientific_colors(exoplanet, planet_type)
     
-    img = Image.new('RGB', (size, size), colors[0])
-    draw = ImageDraw.Draw(img)
-    
-    for r in range(size // 2, 0, -1):
-        alpha = r / (size / 2)
-        color = tuple(int(colors[0][i] * alpha + colors[1][i] * (1 - alpha)) for i in range(3))
-        draw.ellipse([(size//2 - r, size//2 - r), (size//2 + r, size//2 + r)], fill=color)
+    center = size // 2
+    yy, xx = np.ogrid[:size, :size]
+    r = np.clip(np.sqrt((xx - center) ** 2 + (yy - center) ** 2) / center, 0, 1)[..., None]
     
-    return img
+    arr = np.array(colors[0]) * r + np.array(colors[1]) * (1 - r)
+    return Image.fromarray(arr.astype(np.uint8))
 
 
-def image_to_base64(img: Image.Image, format='PNG') -> str:
+def image_to_png_bytes(img: Image.Image) -> bytes:
     buffer = io.BytesIO()
-    img.save(buffer, format=format)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    img.save(buffer, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
+    return buffer.getvalue()
+
+
+def _init_worker():
+    np.random.seed()
+
+
+def build_textures(exoplanet: dict) -> Tuple[object, str, Optional[bytes], Optional[bytes]]:
+    planet_name = exoplanet.get('name', 'Unknown')
+    
+    try:
+        high_res_png = image_to_png_bytes(generate_planet_texture(exoplanet))
+        low_res_png = image_to_png_bytes(generate_simple_texture(exoplanet))
+    except Exception as e:
+        print(f"  ✗ Error generating textures for {planet_name}: {e}")
+        return exoplanet['_id'], planet_name, None, None
+    
+    return exoplanet['_id'], planet_name, high_res_png, low_res_png
+
+
+def flush_updates(collection, ops: list) -> int:
+    if not ops:
+        return 0
+    
+    try:
+        matched = collection.bulk_write(ops, ordered=False).matched_count
+    except BulkWriteError as e:
+        matched = e.details['nMatched']
+        print(f"  ⚠ Bulk write completed with {len(e.details['writeErrors'])} errors")
+    
+    ops.clear()
+    return matched
 
 
-def generate_and_store_textures(limit: Optional[int] = None, mode: str = 'local'):
+def imap_bounded(executor, fn, items, max_in_flight: int):
+    # Unlike executor.map, only pulls from items while fewer than max_in_flight tasks are pending
+    pending = set()
+    for item in items:
+        if len(pending) >= max_in_flight:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+        pending.add(executor.submit(fn, item))
+    
+    for future in as_completed(pending):
+        yield future.result()
+
+
+def generate_and_store_textures(limit: Optional[int] = None, mode: str = 'local', workers: Optional[int] = None):
     print(f"Connecting to MongoDB at {MONGODB_URI}...")
-    client = MongoClient(MONGODB_URI)
+    client = MongoClient(MONGODB_URI, compressors='zstd', w=1, journal=False)
     db = client[DATABASE_NAME]
     collection = db[COLLECTION_NAME]
     
     query = {}
-    exoplanets = list(collection.find(query).limit(limit) if limit else collection.find(query))
-    total = len(exoplanets)
+    exoplanets = collection.find(query, TEXTURE_INPUT_FIELDS, batch_size=500)
+    total = collection.estimated_document_count()
+    if limit:
+        exoplanets = exoplanets.limit(limit)
+        total = min(total, limit)
+    workers = workers or os.cpu_count()
     
-    print(f"Found {total} exoplanets. Generating textures...")
+    print(f"Found {total} exoplanets. Generating textures with {workers} workers...")
     
-    for i, exoplanet in enumerate(exoplanets, 1):
-        planet_id = str(exoplanet['_id'])
-        planet_name = exoplanet.get('name', 'Unknown')
-        
-        print(f"[{i}/{total}] Generating textures for {planet_name}...")
+    ops = []
+    stored = 0
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        results = imap_bounded(executor, build_textures, exoplanets, max_in_flight=4 * workers)
         
-        try:
-            high_res_img = generate_planet_texture(exoplanet)
-            high_res_b64 = image_to_base64(high_res_img)
-            
-            low_res_img = generate_simple_texture(exoplanet)
-            low_res_b64 = image_to_base64(low_res_img)
+        for i, (planet_id, planet_name, high_res_png, low_res_png) in enumerate(results, 1):
+            if high_res_png is None:
+                continue
             
             update_data = {
-                'texture_high_url': f"data:image/png;base64,{high_res_b64}",
-                'texture_low_url': f"data:image/png;base64,{low_res_b64}",
+                'texture_high_png': Binary(high_res_png),
+                'texture_low_png': Binary(low_res_png),
                 'texture_generated_at': datetime.utcnow()
             }
+            legacy_fields = {'texture_high_url': '', 'texture_low_url': ''}
+            ops.append(UpdateOne({'_id': planet_id}, {'$set': update_data, '$unset': legacy_fields}))
+            print(f"[{i}/{total}] ✓ Generated textures for {planet_name} (high: {len(high_res_png)} bytes, low: {len(low_res_png)} bytes)")
             
-            collection.update_one(
-                {'_id': exoplanet['_id']},
-                {'$set': update_data}
-            )
-            
-            print(f"  ✓ Stored textures for {planet_name} (high: {len(high_res_b64)} bytes, low: {len(low_res_b64)} bytes)")
-        
-        except Exception as e:
-            print(f"  ✗ Error generating textures for {planet_name}: {e}")
+            if len(ops) >= BULK_WRITE_BATCH_SIZE:
+                stored += flush_updates(collection, ops)
+    
+    stored += flush_updates(collection, ops)
     
-    print(f"\n✓ Completed! Generated and stored textures for {total} exoplanets")
+    print(f"\n✓ Completed! Generated and stored textures for {stored}/{total} exoplanets")
     client.close()
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Generate exoplanet textures')
     parser.add_argument('--mode', choices=['local', 's3'], default='local',
-                        help='Storage mode: local (Base64 in MongoDB) or s3 (upload to S3)')
+                        help='Storage mode: local (PNG binary in MongoDB) or s3 (upload to S3)')
     parser.add_argument('--limit', type=int, default=None,
                         help='Limit number of planets to process (for testing)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of worker processes (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -370,4 +449,4 @@ if __name__ == '__main__':
         print("S3 mode not yet implemented. Use --mode local for now.")
         sys.exit(1)
     
-    generate_and_store_textures(limit=args.limit, mode=args.mode)
+    generate_and_store_textures(limit=args.limit, mode=args.mode, workers=args.workers)
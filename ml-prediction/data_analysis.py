@@ -35,10 +35,10 @@ print(f"Number of numeric columns: {len(numeric_cols)}")
 
 print("\n" + "="*80)
 print("Columns with high cardinality or identifiers:")
-for col in df.columns:
-    unique_ratio = df[col].nunique() / len(df)
-    if unique_ratio > 0.9:
-        print(f"{col}: {df[col].nunique()} unique values ({unique_ratio*100:.1f}%)")
+unique_counts = df.nunique()
+unique_ratios = unique_counts / len(df)
+for col, unique_ratio in unique_ratios[unique_ratios > 0.9].items():
+    print(f"{col}: {unique_counts[col]} unique values ({unique_ratio*100:.1f}%)")
 
 print("\n" + "="*80)
 print("Key feature columns for analysis:")
@@ -49,6 +49,5 @@ key_features = [
 ]
 available_features = [f for f in key_features if f in df.columns]
 print(f"Available key features: {len(available_features)}")
-for feat in available_features:
-    missing_pct = (df[feat].isnull().sum() / len(df)) * 100
-    print(f"  {feat}: {missing_pct:.1f}% missing")
+for feat, pct in missing_pct[available_features].items():
+    print(f"  {feat}: {pct:.1f}% missing")
@@ -1,35 +1,61 @@
+import argparse
+import hashlib
+import os
 import pandas as pd
 import numpy as np
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from torch.utils.data import Dataset, DataLoader, TensorDataset
+from torch.utils.data import Dataset, DataLoader
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.preprocessing import LabelEncoder
 from sklearn.metrics import (accuracy_score, precision_recall_fscore_support, 
                              confusion_matrix, classification_report, roc_auc_score, roc_curve)
 from sklearn.impute import SimpleImputer
-import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import Tuple, Dict
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 
 class ExoplanetDataPreprocessor:
     
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, use_cache: bool = True):
         self.filepath = filepath
-        self.scaler = StandardScaler()
+        self.use_cache = use_cache
         self.label_encoder = LabelEncoder()
         self.imputer = SimpleImputer(strategy='median')
         self.feature_names = None
         
     def load_data(self) -> pd.DataFrame:
-        df = pd.read_csv(self.filepath, comment='#')
+        cache_path = self.filepath + '.feather'
+        
+        if (self.use_cache and os.path.exists(cache_path)
+                and os.path.getmtime(cache_path) >= os.path.getmtime(self.filepath)):
+            df = pd.read_feather(cache_path)
+        else:
+            df = self.read_csv()
+            if self.use_cache:
+                df.to_feather(cache_path)
+        
         print(f"Loaded dataset: {df.shape}")
         return df
     
+    def read_csv(self) -> pd.DataFrame:
+        # koi_quarters is a 32-digit bitmask that overflows int64, so keep it as text
+        if pl is None:
+            return pd.read_csv(self.filepath, comment='#', dtype={'koi_quarters': str})
+        
+        df = pl.read_csv(self.filepath, comment_prefix='#', infer_schema_length=2000,
+                         schema_overrides={'koi_quarters': pl.Utf8})
+        # Polars infers all-empty columns as strings where pandas uses float64
+        empty_cols = [col for col in df.columns if df[col].null_count() == df.height]
+        return df.with_columns(pl.col(empty_cols).cast(pl.Float64)).to_pandas()
+    
     def remove_identifier_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         cols_to_remove = [
             'rowid', 'kepid', 'kepoi_name', 'kepler_name',
@@ -59,33 +85,65 @@ class ExoplanetDataPreprocessor:
             return df_cleaned
         return df
     
-    def handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
+    def handle_missing_values(self, df: pd.DataFrame, numeric_cols: list) -> pd.DataFrame:
         if 'koi_pdisposition' in df.columns:
             target = df['koi_pdisposition']
             features = df.drop(columns=['koi_pdisposition'])
         else:
             return df
         
-        numeric_cols = features.select_dtypes(include=[np.number]).columns
-        
         if len(numeric_cols) > 0:
-            features_imputed = features.copy()
-            features_imputed[numeric_cols] = self.imputer.fit_transform(features[numeric_cols])
-            features_imputed['koi_pdisposition'] = target
-            
             missing_before = features[numeric_cols].isnull().sum().sum()
-            missing_after = features_imputed[numeric_cols].isnull().sum().sum()
+            
+            features[numeric_cols] = self.impute(features[numeric_cols]).astype(np.float32)
+            features['koi_pdisposition'] = target
+            
+            missing_after = features[numeric_cols].isnull().sum().sum()
             print(f"Imputed {missing_before - missing_after} missing values")
             
-            return features_imputed
+            return features
         
         return df
     
-    def select_features(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+    def impute(self, features: pd.DataFrame) -> np.ndarray:
+        # Only the fitted statistics are cached; pickled estimators break across sklearn versions
+        cache_path = self.filepath + '.imputer.npz'
+        config = repr((features.columns.tolist(), self.imputer.strategy))
+        cache_key = f"{os.path.getmtime(self.filepath)}:{hashlib.sha1(config.encode()).hexdigest()}"
+        
+        if self.use_cache and os.path.exists(cache_path):
+            try:
+                with np.load(cache_path) as cached:
+                    if str(cached['key']) == cache_key:
+                        statistics = cached['statistics']
+                        X = features.to_numpy(dtype=np.float64)
+                        imputed = np.where(np.isnan(X), statistics, X)
+                        self.imputer.statistics_ = statistics
+                        return imputed
+            except Exception as e:
+                print(f"Ignoring unusable imputer cache ({e}), refitting")
+        
+        imputed = self.imputer.fit_transform(features)
+        if self.use_cache:
+            np.savez(cache_path, key=cache_key, statistics=self.imputer.statistics_)
+        return imputed
+    
+    def standardize(self, X: pd.DataFrame) -> np.ndarray:
+        X_scaled = X.to_numpy(dtype=np.float32)
+        
+        self._mean = X_scaled.mean(axis=0, dtype=np.float64)
+        self._std = X_scaled.std(axis=0, dtype=np.float64)
+        self._std[self._std == 0] = 1.0
+        
+        X_scaled -= self._mean.astype(np.float32)
+        X_scaled /= self._std.astype(np.float32)
+        
+        return X_scaled
+    
+    def select_features(self, df: pd.DataFrame, numeric_cols: list) -> Tuple[pd.DataFrame, pd.Series]:
         y = df['koi_pdisposition'].copy()
         
-        X = df.drop(columns=['koi_pdisposition'])
-        X = X.select_dtypes(include=[np.number])
+        X = df[numeric_cols]
         
         X = X.dropna(axis=1, how='all')
         
@@ -94,22 +152,58 @@ class ExoplanetDataPreprocessor:
         
         return X, y
     
-    def preprocess(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, list]:
+    def preprocess(self, df: pd.DataFrame, threshold: float = 0.5) -> Tuple[np.ndarray, np.ndarray, list]:
+        cache_path = self.filepath + '.preprocessed.npz'
+        cache_key = self.cache_key(df.columns.tolist(), threshold)
+        
+        if self.use_cache and os.path.exists(cache_path):
+            with np.load(cache_path) as cached:
+                if str(cached['key']) == cache_key:
+                    return self.restore_preprocessed(cached)
+        
         df = self.remove_identifier_columns(df)
         
-        df = self.remove_high_missing_columns(df, threshold=0.5)
+        df = self.remove_high_missing_columns(df, threshold=threshold)
         
-        df = self.handle_missing_values(df)
+        self._numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
         
-        X, y = self.select_features(df)
+        df = self.handle_missing_values(df, self._numeric_cols)
+        
+        X, y = self.select_features(df, self._numeric_cols)
         
         y_encoded = self.label_encoder.fit_transform(y)
         print(f"Label encoding: {dict(zip(self.label_encoder.classes_, [0, 1]))}")
         
-        X_scaled = self.scaler.fit_transform(X)
+        X_scaled = self.standardize(X)
         
         print(f"Final shape: X={X_scaled.shape}, y={y_encoded.shape}")
         
+        if self.use_cache:
+            np.savez(cache_path, key=cache_key, X=X_scaled, y=y_encoded,
+                     features=np.array(self.feature_names),
+                     mean=self._mean, std=self._std,
+                     medians=self.imputer.statistics_,
+                     classes=self.label_encoder.classes_.astype(str))
+        
+        return X_scaled, y_encoded, self.feature_names
+    
+    def cache_key(self, columns: list, threshold: float = 0.5) -> str:
+        config = repr((columns, threshold, self.imputer.strategy))
+        return f"{os.path.getmtime(self.filepath)}:{hashlib.sha1(config.encode()).hexdigest()}"
+    
+    def read_columns(self) -> list:
+        return pd.read_csv(self.filepath, comment='#', nrows=0).columns.tolist()
+    
+    def restore_preprocessed(self, cached) -> Tuple[np.ndarray, np.ndarray, list]:
+        X_scaled, y_encoded = cached['X'], cached['y']
+        
+        self.feature_names = cached['features'].tolist()
+        self._mean = cached['mean']
+        self._std = cached['std']
+        self.imputer.statistics_ = cached['medians']
+        self.label_encoder.classes_ = cached['classes'].astype(object)
+        
+        print(f"Loaded preprocessed arrays from cache: X={X_scaled.shape}, y={y_encoded.shape}")
         return X_scaled, y_encoded, self.feature_names
 
 
@@ -122,9 +216,9 @@ class ExoplanetClassifier(nn.Module):
         prev_dim = input_dim
         
         for i, hidden_dim in enumerate(hidden_dims):
-            layers.append(nn.BatchNorm1d(prev_dim))
             layers.append(nn.Linear(prev_dim, hidden_dim))
-            layers.append(nn.ReLU())
+            layers.append(nn.BatchNorm1d(hidden_dim))
+            layers.append(nn.ReLU(inplace=True))
             drop_rate = dropout if i < len(hidden_dims) - 1 else dropout * 0.7
             layers.append(nn.Dropout(drop_rate))
             prev_dim = hidden_dim
@@ -137,69 +231,112 @@ class ExoplanetClassifier(nn.Module):
         return self.network(x)
 
 
+class InMemoryLoader:
+    
+    def __init__(self, X: np.ndarray, y: np.ndarray, batch_size: int = 64, 
+                 shuffle: bool = False, device: str = 'cpu'):
+        self.X = self._upload(torch.from_numpy(np.ascontiguousarray(X, dtype=np.float32)), device)
+        self.y = self._upload(torch.from_numpy(y.astype(np.int64, copy=False)), device)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        
+    @staticmethod
+    def _upload(tensor: torch.Tensor, device: str) -> torch.Tensor:
+        if torch.device(device).type == 'cuda':
+            return tensor.pin_memory().to(device, non_blocking=True)
+        return tensor
+    
+    def __len__(self) -> int:
+        return (len(self.X) + self.batch_size - 1) // self.batch_size
+    
+    def __iter__(self):
+        n = len(self.X)
+        if not self.shuffle:
+            for i in range(0, n, self.batch_size):
+                yield self.X[i:i + self.batch_size], self.y[i:i + self.batch_size]
+            return
+        
+        idx = torch.randperm(n, device=self.X.device)
+        for i in range(0, n, self.batch_size):
+            batch_idx = idx[i:i + self.batch_size]
+            yield self.X[batch_idx], self.y[batch_idx]
+
+
 class ModelTrainer:
     
     def __init__(self, model: nn.Module, device: str = 'cuda' if torch.cuda.is_available() else 'cpu'):
         self.model = model.to(device)
         self.device = device
+        self.device_type = torch.device(device).type
+        self.use_amp = self.device_type == 'cuda' and torch.cuda.is_bf16_supported()
         self.train_losses = []
         self.val_losses = []
         self.train_accs = []
         self.val_accs = []
         
+    def autocast(self):
+        return torch.autocast(device_type=self.device_type, dtype=torch.bfloat16, enabled=self.use_amp)
+    
     def train_epoch(self, train_loader: DataLoader, optimizer: optim.Optimizer, 
-                   criterion: nn.Module) -> Tuple[float, float]:
+                   criterion: nn.Module, compute_acc: bool = True) -> Tuple[float, float]:
         self.model.train()
-        total_loss = 0
-        correct = 0
+        total_loss = torch.zeros((), device=self.device)
+        correct = torch.zeros((), dtype=torch.long, device=self.device)
         total = 0
         
         for X_batch, y_batch in train_loader:
-            X_batch, y_batch = X_batch.to(self.device), y_batch.to(self.device)
+            X_batch = X_batch.to(self.device, non_blocking=True)
+            y_batch = y_batch.to(self.device, non_blocking=True)
             
             optimizer.zero_grad()
-            outputs = self.model(X_batch)
-            loss = criterion(outputs, y_batch)
+            with self.autocast():
+                outputs = self.model(X_batch)
+                loss = criterion(outputs, y_batch)
             
             loss.backward()
             optimizer.step()
             
-            total_loss += loss.item()
-            _, predicted = torch.max(outputs.data, 1)
-            total += y_batch.size(0)
-            correct += (predicted == y_batch).sum().item()
+            total_loss += loss.detach()
+            if compute_acc:
+                _, predicted = torch.max(outputs.data, 1)
+                total += y_batch.size(0)
+                correct += (predicted == y_batch).sum()
         
-        avg_loss = total_loss / len(train_loader)
-        accuracy = 100 * correct / total
+        avg_loss = total_loss.item() / len(train_loader)
+        if not compute_acc:
+            return avg_loss, None
+        accuracy = 100 * correct.item() / total
         
         return avg_loss, accuracy
     
     def validate(self, val_loader: DataLoader, criterion: nn.Module) -> Tuple[float, float]:
         self.model.eval()
-        total_loss = 0
-        correct = 0
+        total_loss = torch.zeros((), device=self.device)
+        correct = torch.zeros((), dtype=torch.long, device=self.device)
         total = 0
         
         with torch.no_grad():
             for X_batch, y_batch in val_loader:
-                X_batch, y_batch = X_batch.to(self.device), y_batch.to(self.device)
+                X_batch = X_batch.to(self.device, non_blocking=True)
+                y_batch = y_batch.to(self.device, non_blocking=True)
                 
-                outputs = self.model(X_batch)
-                loss = criterion(outputs, y_batch)
+                with self.autocast():
+                    outputs = self.model(X_batch)
+                    loss = criterion(outputs, y_batch)
                 
-                total_loss += loss.item()
+                total_loss += loss.detach()
                 _, predicted = torch.max(outputs.data, 1)
                 total += y_batch.size(0)
-                correct += (predicted == y_batch).sum().item()
+                correct += (predicted == y_batch).sum()
         
-        avg_loss = total_loss / len(val_loader)
-        accuracy = 100 * correct / total
+        avg_loss = total_loss.item() / len(val_loader)
+        accuracy = 100 * correct.item() / total
         
         return avg_loss, accuracy
     
     def train(self, train_loader: DataLoader, val_loader: DataLoader, 
              epochs: int = 50, lr: float = 0.001, patience: int = 10,
-             class_weights: torch.Tensor = None):
+             class_weights: torch.Tensor = None, log_every: int = 5):
         if class_weights is not None:
             class_weights = class_weights.to(self.device)
             print(f"Using class weights: {class_weights.cpu().numpy()}")
@@ -216,12 +353,14 @@ class ModelTrainer:
         print("=" * 80)
         
         for epoch in range(epochs):
-            train_loss, train_acc = self.train_epoch(train_loader, optimizer, criterion)
+            log_epoch = (epoch + 1) % log_every == 0
+            train_loss, train_acc = self.train_epoch(train_loader, optimizer, criterion,
+                                                     compute_acc=log_epoch)
             val_loss, val_acc = self.validate(val_loader, criterion)
             
             self.train_losses.append(train_loss)
             self.val_losses.append(val_loss)
-            self.train_accs.append(train_acc)
+            self.train_accs.append(train_acc if log_epoch else np.nan)
             self.val_accs.append(val_acc)
             
             scheduler.step(val_loss)
@@ -229,11 +368,11 @@ class ModelTrainer:
             if val_loss < best_val_loss:
                 best_val_loss = val_loss
                 patience_counter = 0
-                best_model_state = self.model.state_dict().copy()
+                best_model_state = {k: v.detach().clone() for k, v in self.model.state_dict().items()}
             else:
                 patience_counter += 1
             
-            if (epoch + 1) % 5 == 0:
+            if log_epoch:
                 print(f"Epoch [{epoch+1}/{epochs}] - "
                       f"Train Loss: {train_loss:.4f}, Train Acc: {train_acc:.2f}% | "
                       f"Val Loss: {val_loss:.4f}, Val Acc: {val_acc:.2f}%")
@@ -255,15 +394,17 @@ class ModelTrainer:
         
         with torch.no_grad():
             for X_batch, _ in data_loader:
-                X_batch = X_batch.to(self.device)
-                outputs = self.model(X_batch)
+                X_batch = X_batch.to(self.device, non_blocking=True)
+                with self.autocast():
+                    outputs = self.model(X_batch)
+                outputs = outputs.float()
                 probs = torch.softmax(outputs, dim=1)
                 _, predicted = torch.max(outputs, 1)
                 
-                all_preds.extend(predicted.cpu().numpy())
-                all_probs.extend(probs.cpu().numpy())
+                all_preds.append(predicted)
+                all_probs.append(probs)
         
-        return np.array(all_preds), np.array(all_probs)
+        return torch.cat(all_preds).cpu().numpy(), torch.cat(all_probs).cpu().numpy()
     
     def evaluate(self, test_loader: DataLoader, y_test: np.ndarray, 
                 label_encoder: LabelEncoder) -> Dict:
@@ -302,6 +443,8 @@ class ModelTrainer:
         }
     
     def plot_training_history(self, save_path: str = 'training_history.png'):
+        import matplotlib.pyplot as plt
+        
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
         
         ax1.plot(self.train_losses, label='Train Loss', linewidth=2)
@@ -312,7 +455,10 @@ class ModelTrainer:
         ax1.legend()
         ax1.grid(True, alpha=0.3)
         
-        ax2.plot(self.train_accs, label='Train Accuracy', linewidth=2)
+        # Train accuracy is only measured on logged epochs
+        train_accs = np.array(self.train_accs)
+        logged = np.flatnonzero(~np.isnan(train_accs))
+        ax2.plot(logged, train_accs[logged], label='Train Accuracy', linewidth=2)
         ax2.plot(self.val_accs, label='Validation Accuracy', linewidth=2)
         ax2.set_xlabel('Epoch', fontsize=12)
         ax2.set_ylabel('Accuracy (%)', fontsize=12)
@@ -326,7 +472,40 @@ class ModelTrainer:
         plt.close()
 
 
-def main():
+def plot_confusion_matrix(cm: np.ndarray, class_names, save_path: str = 'confusion_matrix.png'):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    plt.figure(figsize=(8, 6))
+    sns.heatmap(cm, annot=True, fmt='d', cmap='Blues',
+                xticklabels=class_names,
+                yticklabels=class_names)
+    plt.xlabel('Predicted', fontsize=12)
+    plt.ylabel('Actual', fontsize=12)
+    plt.title('Confusion Matrix', fontsize=14)
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    print(f"Confusion matrix saved to: {save_path}")
+    plt.close()
+
+
+def compile_for_training(model: nn.Module, X_sample: torch.Tensor) -> nn.Module:
+    # Compilation is lazy, so run one step here to fall back to eager if the toolchain is missing
+    state = {k: v.detach().clone() for k, v in model.state_dict().items()}
+    try:
+        compiled = torch.compile(model, mode='reduce-overhead')
+        compiled(X_sample).sum().backward()
+    except Exception as e:
+        print(f"torch.compile failed ({type(e).__name__}: {e}), training the eager model")
+        compiled = model
+    
+    # Undo the warm-up step's gradients and BatchNorm statistics
+    model.zero_grad(set_to_none=True)
+    model.load_state_dict(state)
+    return compiled
+
+
+def main(plot: bool = True):
     print("=" * 80)
     print("EXOPLANET DISPOSITION CLASSIFIER")
     print("=" * 80)
@@ -350,17 +529,9 @@ def main():
     print(f"Test class distribution: {np.bincount(y_test)}")
     
     print("\n[3] Creating PyTorch dataloaders...")
-    train_dataset = TensorDataset(
-        torch.FloatTensor(X_train), 
-        torch.LongTensor(y_train)
-    )
-    test_dataset = TensorDataset(
-        torch.FloatTensor(X_test), 
-        torch.LongTensor(y_test)
-    )
-    
-    train_loader = DataLoader(train_dataset, batch_size=64, shuffle=True)
-    test_loader = DataLoader(test_dataset, batch_size=64, shuffle=False)
+    device = 'cuda' if torch.cuda.is_available() else 'cpu'
+    train_loader = InMemoryLoader(X_train, y_train, batch_size=64, shuffle=True, device=device)
+    test_loader = InMemoryLoader(X_test, y_test, batch_size=64, shuffle=False, device=device)
     
     print("\n[4] Initializing neural network...")
     input_dim = X_train.shape[1]
@@ -383,7 +554,12 @@ def main():
     print(f"Class weights: CANDIDATE={candidate_weight}, FALSE_POSITIVE={false_positive_weight}")
    
     print("\n[5] Training model...")
-    trainer = ModelTrainer(model)
+    # Opt-in: CUDA graphs are what reduce-overhead buys us; otherwise the eager model is used as-is.
+    # The uncompiled module shares its parameters, so it is still what gets saved below.
+    train_model = model
+    if device == 'cuda' and os.environ.get('EXOEXPLORER_COMPILE') == '1':
+        train_model = compile_for_training(model, train_loader.X[:64])
+    trainer = ModelTrainer(train_model, device)
     trainer.train(train_loader, test_loader, epochs=200, lr=0.001, patience=50, 
                  class_weights=class_weights)
     
@@ -394,29 +570,17 @@ def main():
     torch.save(model.state_dict(), 'exoplanet_classifier.pth')
     print("Model saved to: exoplanet_classifier.pth")
     
-    import pickle
-    with open('preprocessor.pkl', 'wb') as f:
-        pickle.dump({
-            'scaler': preprocessor.scaler,
-            'label_encoder': preprocessor.label_encoder,
-            'imputer': preprocessor.imputer,
-            'feature_names': feature_names
-        }, f)
-    print("Preprocessor saved to: preprocessor.pkl")
+    np.savez_compressed('preprocessor.npz',
+                        mean=preprocessor._mean,
+                        scale=preprocessor._std,
+                        medians=preprocessor.imputer.statistics_,
+                        classes=preprocessor.label_encoder.classes_.astype(str),
+                        feature_names=np.array(feature_names))
+    print("Preprocessor saved to: preprocessor.npz")
     
-    trainer.plot_training_history()
-    
-    plt.figure(figsize=(8, 6))
-    sns.heatmap(results['confusion_matrix'], annot=True, fmt='d', cmap='Blues',
-                xticklabels=preprocessor.label_encoder.classes_,
-                yticklabels=preprocessor.label_encoder.classes_)
-    plt.xlabel('Predicted', fontsize=12)
-    plt.ylabel('Actual', fontsize=12)
-    plt.title('Confusion Matrix', fontsize=14)
-    plt.tight_layout()
-    plt.savefig('confusion_matrix.png', dpi=300, bbox_inches='tight')
-    print("Confusion matrix saved to: confusion_matrix.png")
-    plt.close()
+    if plot:
+        trainer.plot_training_history()
+        plot_confusion_matrix(results['confusion_matrix'], preprocessor.label_encoder.classes_)
     
     print("\n" + "=" * 80)
     print("TRAINING COMPLETE!")
@@ -424,4 +588,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description='Train the exoplanet disposition classifier')
+    parser.add_argument('--no-plot', action='store_true',
+                        help='Skip the training history and confusion matrix figures')
+    
+    args = parser.parse_args()
+    main(plot=not args.no_plot)
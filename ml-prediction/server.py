@@ -1,16 +1,16 @@
 from fastapi import FastAPI, HTTPException, Body
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import Any, Dict, List, Tuple
-import pickle
 import torch
 import numpy as np
-import pandas as pd
 import os
+import threading
 
 from exoplanet_classifier import ExoplanetClassifier
 
 
-app = FastAPI(title="ExoExplorer - Exoplanet Disposition Classifier")
+app = FastAPI(title="ExoExplorer - Exoplanet Disposition Classifier", default_response_class=ORJSONResponse)
 
 app.add_middleware(
 	CORSMiddleware,
@@ -21,21 +21,24 @@ app.add_middleware(
 )
 
 
-PREPROCESSOR_PATH = os.path.join(os.path.dirname(__file__), 'preprocessor.pkl')
+PREPROCESSOR_PATH = os.path.join(os.path.dirname(__file__), 'preprocessor.npz')
 MODEL_PATH = os.path.join(os.path.dirname(__file__), 'exoplanet_classifier.pth')
 
 if not os.path.exists(PREPROCESSOR_PATH):
-	raise RuntimeError(f'preprocessor.pkl not found at {PREPROCESSOR_PATH}')
+	raise RuntimeError(f'preprocessor.npz not found at {PREPROCESSOR_PATH}')
 if not os.path.exists(MODEL_PATH):
 	raise RuntimeError(f'exoplanet_classifier.pth not found at {MODEL_PATH}')
 
-with open(PREPROCESSOR_PATH, 'rb') as f:
-	_prep = pickle.load(f)
+with np.load(PREPROCESSOR_PATH) as _prep:
+	MEAN = _prep['mean']
+	SCALE = _prep['scale']
+	MEDIANS = _prep['medians']
+	CLASSES: List[str] = _prep['classes'].tolist()
+	FEATURE_NAMES: List[str] = _prep['feature_names'].tolist()
 
-SCALER = _prep['scaler']
-LABEL_ENCODER = _prep['label_encoder']
-IMPUTER = _prep['imputer']
-FEATURE_NAMES: List[str] = _prep['feature_names']
+# Clients may send feature names with or without the koi_ prefix
+FEATURE_PREFIX = 'koi_'
+SHORT_FEATURE_NAMES = tuple(n[len(FEATURE_PREFIX):] if n.startswith(FEATURE_PREFIX) else n for n in FEATURE_NAMES)
 
 DEVICE = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
 MODEL = ExoplanetClassifier(input_dim=len(FEATURE_NAMES))
@@ -47,6 +50,65 @@ else:
 MODEL.to(DEVICE)
 MODEL.eval()
 
+if DEVICE.type == 'cpu':
+	# int8 weights with per-call activation ranges; fine for the single-row requests served here
+	MODEL = torch.ao.quantization.quantize_dynamic(MODEL, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+# Median imputation, standardization and the classifier fused into one scripted call
+class Pipeline(torch.nn.Module):
+	def __init__(self, model: torch.nn.Module, medians: np.ndarray, mean: np.ndarray, scale: np.ndarray):
+		super().__init__()
+		self.model = model
+		self.register_buffer('medians', torch.as_tensor(medians, dtype=torch.float32))
+		self.register_buffer('mean', torch.as_tensor(mean, dtype=torch.float32))
+		self.register_buffer('scale', torch.as_tensor(scale, dtype=torch.float32))
+
+	def forward(self, x: torch.Tensor) -> torch.Tensor:
+		x = torch.where(torch.isnan(x), self.medians, x)
+		x = (x - self.mean) / self.scale
+		return torch.softmax(self.model(x), dim=1)
+
+
+PIPELINE = Pipeline(MODEL, MEDIANS, MEAN, SCALE).to(DEVICE).eval()
+SCRIPTED_PIPELINE = torch.jit.script(PIPELINE)
+COMPILED_PIPELINE = None
+
+if DEVICE.type == 'cuda':
+	HOST_BUFFER = torch.empty((1, len(FEATURE_NAMES)), pin_memory=True)
+	DEVICE_BUFFER = torch.zeros((1, len(FEATURE_NAMES)), device=DEVICE)
+	# Requests run in FastAPI's threadpool, so the shared buffers need a lock
+	BUFFER_LOCK = threading.Lock()
+
+	# Opt-in: every request reuses DEVICE_BUFFER, so the pipeline can replay as one captured CUDA graph.
+	# Warming up here pays for compilation; graph capture may still happen again in the worker threads.
+	if os.environ.get('EXOEXPLORER_COMPILE') == '1':
+		try:
+			COMPILED_PIPELINE = torch.compile(PIPELINE, mode='reduce-overhead', fullgraph=True)
+			with torch.inference_mode():
+				for _ in range(3):
+					COMPILED_PIPELINE(DEVICE_BUFFER)
+		except Exception:
+			COMPILED_PIPELINE = None
+
+
+def _forward(X: torch.Tensor) -> torch.Tensor:
+	global COMPILED_PIPELINE
+
+	if DEVICE.type != 'cuda':
+		return SCRIPTED_PIPELINE(X)
+
+	with BUFFER_LOCK:
+		HOST_BUFFER.copy_(X)
+		DEVICE_BUFFER.copy_(HOST_BUFFER, non_blocking=True)
+		if COMPILED_PIPELINE is not None:
+			try:
+				return COMPILED_PIPELINE(DEVICE_BUFFER).cpu()
+			except Exception:
+				# Stay on the scripted pipeline for the rest of the process
+				COMPILED_PIPELINE = None
+		return SCRIPTED_PIPELINE(DEVICE_BUFFER).cpu()
+
 
 @app.get('/health')
 def health() -> Dict[str, str]:
@@ -57,35 +119,35 @@ def health() -> Dict[str, str]:
 def features() -> Dict:
 	return {"feature_count": len(FEATURE_NAMES), "feature_names": FEATURE_NAMES}
 
-def _prepare_from_flexible_input(body: Dict[str, Any], prefix: str = 'koi_') -> Tuple[np.ndarray, Dict[str, Any]]:
-	provided = set(body.keys())
-	short_expected = [n[len(prefix):] if n.startswith(prefix) else n for n in FEATURE_NAMES]
-	short_set = set(short_expected)
-
-	extras = list(provided - set(FEATURE_NAMES) - short_set)
-
-	prefixed = {}
+def _prepare_from_flexible_input(body: Dict[str, Any]) -> Tuple[torch.Tensor, Dict[str, Any]]:
+	X = np.full((1, len(FEATURE_NAMES)), np.nan, dtype=np.float32)
 	filled = []
-	for fname, short in zip(FEATURE_NAMES, short_expected):
+	for i, (fname, short) in enumerate(zip(FEATURE_NAMES, SHORT_FEATURE_NAMES)):
 		if fname in body:
-			prefixed[fname] = body[fname]
+			value = body[fname]
 		elif short in body:
-			prefixed[fname] = body[short]
+			value = body[short]
 		else:
-			prefixed[fname] = np.nan
 			filled.append(fname)
-
-	df = pd.DataFrame([prefixed], columns=FEATURE_NAMES)
-	df = df.apply(pd.to_numeric, errors='coerce')
-	X_imputed = IMPUTER.transform(df.values)
-	X_scaled = SCALER.transform(X_imputed)
+			continue
+
+		# Values that are not numeric stay NaN and get median-filled like missing ones
+		try:
+			with np.errstate(over='ignore'):
+				value = np.float32(float(value))
+		except (TypeError, ValueError):
+			continue
+		# inf, and anything that overflows float32, can't be imputed or standardized
+		if np.isinf(value):
+			raise ValueError(f'{fname} must be a finite number')
+		X[0, i] = value
 
 	meta = {'not_provided': filled}
-	return X_scaled, meta
+	return torch.from_numpy(X), meta
 
 
 @app.post('/predict')
-def predict(body: Dict[str, Any] = Body(...)) -> Dict:
+def predict(body: Dict[str, Any] = Body(...), include_schema: bool = False) -> Dict:
 	if not isinstance(body, dict):
 		raise HTTPException(status_code=400, detail='Request body must be a JSON object (dict)')
 
@@ -94,19 +156,20 @@ def predict(body: Dict[str, Any] = Body(...)) -> Dict:
 	except Exception as e:
 		raise HTTPException(status_code=400, detail=f'Error preparing input: {e}')
 
-	X_tensor = torch.from_numpy(X).float().to(DEVICE)
-	with torch.no_grad():
-		outputs = MODEL(X_tensor)
-		probs = torch.softmax(outputs, dim=1).cpu().numpy()[0]
+	with torch.inference_mode():
+		probs = _forward(X).numpy()[0]
 		pred_idx = int(np.argmax(probs))
-		pred_label = str(LABEL_ENCODER.inverse_transform([pred_idx])[0])
+		pred_label = CLASSES[pred_idx]
 
-	return {
+	response = {
 		'prediction': pred_label,
 		'probabilities': probs.tolist(),
 		'meta': meta,
-		'feature_order': FEATURE_NAMES,
 	}
+	# The feature order never changes; clients should fetch it once from /features
+	if include_schema:
+		response['feature_order'] = FEATURE_NAMES
+	return response
 
 
 if __name__ == '__main__':
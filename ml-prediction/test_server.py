@@ -0,0 +1,31 @@
+import unittest
+
+from fastapi.testclient import TestClient
+
+from server import app
+
+
+class PredictInputTest(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		cls.client = TestClient(app)
+
+	def test_numeric_value(self):
+		r = self.client.post('/predict', json={'koi_period': 10.5})
+		self.assertEqual(r.status_code, 200)
+		self.assertNotIn('koi_period', r.json()['meta']['not_provided'])
+
+	def test_nan_is_median_filled(self):
+		r = self.client.post('/predict', json={'koi_period': 'nan'})
+		self.assertEqual(r.status_code, 200)
+		self.assertTrue(all(p is not None for p in r.json()['probabilities']))
+
+	def test_inf_is_rejected(self):
+		for value in ('inf', '-inf', 1e300, '1e300'):
+			with self.subTest(value=value):
+				r = self.client.post('/predict', json={'koi_period': value})
+				self.assertEqual(r.status_code, 400)
+
+
+if __name__ == '__main__':
+	unittest.main()
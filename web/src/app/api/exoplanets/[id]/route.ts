@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { ObjectId } from 'mongodb';
 import { getDatabase } from '@/lib/mongodb';
+import { withTextureUrls } from '@/lib/textures';
 
 interface RouteParams {
   params: Promise<{
@@ -42,6 +43,8 @@ export async function GET(
       star_age: 1,
       texture_high_url: 1,
       texture_low_url: 1,
+      texture_high_png: 1,
+      texture_low_png: 1,
     };
 
     // Find exoplanet by ID
@@ -57,7 +60,7 @@ export async function GET(
       );
     }
 
-    return NextResponse.json(exoplanet);
+    return NextResponse.json(withTextureUrls(exoplanet));
   } catch (error) {
     console.error('Error fetching exoplanet:', error);
     return NextResponse.json(
@@ -1,5 +1,6 @@
 import { NextResponse } from 'next/server';
 import { getDatabase } from '@/lib/mongodb';
+import { withTextureUrls } from '@/lib/textures';
 
 export async function GET() {
   try {
@@ -22,6 +23,8 @@ export async function GET() {
       star_age: 1,
       texture_high_url: 1,
       texture_low_url: 1,
+      texture_high_png: 1,
+      texture_low_png: 1,
     };
 
     // Get all exoplanets
@@ -30,7 +33,7 @@ export async function GET() {
       .sort({ name: 1 })
       .toArray();
 
-    return NextResponse.json(exoplanets);
+    return NextResponse.json(exoplanets.map(withTextureUrls));
   } catch (error) {
     console.error('Error fetching all exoplanets:', error);
     return NextResponse.json(
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getDatabase } from '@/lib/mongodb';
+import { withTextureUrls } from '@/lib/textures';
 import { ExoplanetSearchParams } from '@/lib/types';
 
 export async function GET(request: NextRequest) {
@@ -92,6 +93,8 @@ export async function GET(request: NextRequest) {
       star_age: 1,
       texture_high_url: 1,
       texture_low_url: 1,
+      texture_high_png: 1,
+      texture_low_png: 1,
     };
 
     // Execute query
@@ -103,7 +106,7 @@ export async function GET(request: NextRequest) {
 
     const exoplanets = await query.toArray();
 
-    return NextResponse.json(exoplanets);
+    return NextResponse.json(exoplanets.map(withTextureUrls));
   } catch (error) {
     console.error('Error fetching exoplanets:', error);
     return NextResponse.json(
@@ -1,5 +1,6 @@
 import OpenAI from 'openai';
 import { getDatabase } from './mongodb';
+import { withTextureUrls } from './textures';
 
 // Initialize OpenAI client
 const openai = new OpenAI({
@@ -178,7 +179,7 @@ export async function queryExoplanetsWithNaturalLanguage(userPrompt: string): Pr
     query = query.limit(limit);
     
     // Execute and return results
-    const results = await query.toArray();
+    const results = (await query.toArray()).map(withTextureUrls);
     
     console.log(`Query returned ${results.length} results`);
     
@@ -0,0 +1,26 @@
+import { Binary, Document } from 'mongodb';
+
+// Raw PNG texture fields stored in MongoDB and the URL fields the client expects
+const TEXTURE_FIELDS = [
+  ['texture_high_png', 'texture_high_url'],
+  ['texture_low_png', 'texture_low_url'],
+] as const;
+
+/**
+ * Converts binary PNG textures into data URLs for the client
+ * @param doc - Exoplanet document as returned by MongoDB
+ * @returns The same document with texture_*_url fields populated
+ */
+export function withTextureUrls<T extends Document>(doc: T): T {
+  const result: Document = doc;
+
+  for (const [binaryField, urlField] of TEXTURE_FIELDS) {
+    const data = result[binaryField];
+    if (data instanceof Binary) {
+      result[urlField] = `data:image/png;base64,${data.toString('base64')}`;
+    }
+    delete result[binaryField];
+  }
+
+  return doc;
+}